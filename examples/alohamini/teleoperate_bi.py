@@ -1,139 +1,261 @@
 import argparse
-import inspect
-import os
+import threading
 import time
+from collections import deque
 
 from lerobot.robots.alohamini import AlohaMiniClient, AlohaMiniClientConfig
 from lerobot.teleoperators.keyboard.teleop_keyboard import KeyboardTeleop, KeyboardTeleopConfig
 from lerobot.teleoperators.bi_so_leader import BiSOLeader, BiSOLeaderConfig
 from lerobot.teleoperators.so_leader import SOLeaderConfig
-from lerobot.utils.robot_utils import precise_sleep
+from lerobot.utils.robot_utils import precise_sleep_until, request_realtime_scheduling
 from lerobot.utils.visualization_utils import init_rerun, log_rerun_data
 
-# ============ Parameter Section ============ #
-parser = argparse.ArgumentParser()
-parser.add_argument("--no_robot", action="store_true", help="Do not connect robot, only print actions")
-parser.add_argument("--no_leader", action="store_true", help="Do not connect leader arm, only perform keyboard-controlled actions.")
-parser.add_argument("--fps", type=int, default=30, help="Main loop frequency (frames per second)")
-parser.add_argument(
-    "--robot.remote_ip",
-    "--remote_ip",
-    dest="remote_ip",
-    type=str,
-    default="127.0.0.1",
-    help="AlohaMini host IP address",
-)
-parser.add_argument(
-    "--robot.id",
-    "--robot_id",
-    dest="robot_id",
-    type=str,
-    default="my_alohamini",
-    help="Robot ID",
-)
-parser.add_argument(
-    "--robot.robot_model",
-    "--robot_model",
-    dest="robot_model",
-    type=str,
-    default="alohamini1",
-    choices=["alohamini1", "alohamini2", "alohamini2pro"],
-    help="AlohaMini model. Must match the --robot_model used on the Pi host side.",
-)
-parser.add_argument(
-    "--teleop.id",
-    "--leader_id",
-    dest="leader_id",
-    type=str,
-    default="so101_leader_bi",
-    help="Leader arm device ID",
-)
-parser.add_argument(
-    "--teleop.arm_profile",
-    "--arm_profile",
-    dest="arm_profile",
-    type=str,
-    default="so-arm-5dof",
-    choices=["so-arm-5dof", "am-leader-6dof"],
-    help="Leader arm profile selector.",
-)
-
-args = parser.parse_args()
-
-NO_ROBOT = args.no_robot
-NO_LEADER = args.no_leader
-FPS = args.fps
-# ========================================== #
-
-if NO_ROBOT:
-    print("🧪 NO_ROBOT mode enabled: robot will not connect, only print actions.")
-
-if NO_LEADER:
-    print("🧪 NO_LEADER mode enabled: leader arm will not connect, only print actions.")
-# Create configs
-robot_config = AlohaMiniClientConfig(
-    remote_ip=args.remote_ip,
-    id=args.robot_id,
-    robot_model=args.robot_model,
-)
-bi_cfg = BiSOLeaderConfig(
-    left_arm_config=SOLeaderConfig(
-        port="/dev/am_arm_leader_left",
-        arm_profile=args.arm_profile,
-    ),
-    right_arm_config=SOLeaderConfig(
-        port="/dev/am_arm_leader_right",
-        arm_profile=args.arm_profile,
-    ),
-    id=args.leader_id,
-)
-leader = BiSOLeader(bi_cfg)
-keyboard_config = KeyboardTeleopConfig(id="my_laptop_keyboard")
-keyboard = KeyboardTeleop(keyboard_config)
-robot = AlohaMiniClient(robot_config)
-
-# Connection logic
-if not NO_ROBOT:
-    robot.connect()
-else:
-    print("🧪 robot.connect() skipped, only printing actions.")
-
-if not NO_LEADER:
-    leader.connect()
-else:
-    print("🧪 robot.connect() skipped, only printing actions.")
-
-keyboard.connect()
-
-
-
-init_rerun(session_name="alohamini_teleop")
-
-if not robot.is_connected or not leader.is_connected or not keyboard.is_connected:
-    print("⚠️ Warning: Some devices are not connected! Still running for debug.")
-
-# Main loop
-while True:
-    t0 = time.perf_counter()
-
-    observation = robot.get_observation() if not NO_ROBOT else {}
-    arm_actions = leader.get_action() if not NO_LEADER else {}
-    arm_actions = {f"arm_{k}": v for k, v in arm_actions.items()}
-    keyboard_keys = keyboard.get_action()
-    base_action = robot._from_keyboard_to_base_action(keyboard_keys)
-    lift_action = robot._from_keyboard_to_lift_action(keyboard_keys)
-
-    action = {**arm_actions, **base_action, **lift_action}
-    log_rerun_data(observation, action)
-
-    if not NO_ROBOT:
-        robot.send_action(action)
-
-    precise_sleep(max(1.0 / FPS - (time.perf_counter() - t0), 0.0))
-    loop_dt = time.perf_counter() - t0
-    loop_fps = 1.0 / loop_dt if loop_dt > 0 else float("inf")
-
-    if NO_ROBOT:
-        print(f"[fps={loop_fps:.1f}] [NO_ROBOT] action → {action}")
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--no_robot", action="store_true", help="Do not connect robot, only print actions")
+    parser.add_argument("--no_leader", action="store_true", help="Do not connect leader arm, only perform keyboard-controlled actions.")
+    parser.add_argument("--fps", type=int, default=30, help="Main loop frequency (frames per second)")
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the sent action and loop fps (throttled, off the control loop)",
+    )
+    parser.add_argument(
+        "--rt",
+        action="store_true",
+        help=(
+            "Request SCHED_FIFO real-time scheduling and pin the teleop loop to one CPU core. "
+            "Needs root or CAP_SYS_NICE (sudo setcap cap_sys_nice+ep $(readlink -f $(which python))), "
+            "or launch via chrt -f 80."
+        ),
+    )
+    parser.add_argument(
+        "--rt_core",
+        type=int,
+        default=2,
+        help="CPU core to pin the teleop loop to when --rt is set",
+    )
+    parser.add_argument(
+        "--robot.remote_ip",
+        "--remote_ip",
+        dest="remote_ip",
+        type=str,
+        default="127.0.0.1",
+        help="AlohaMini host IP address",
+    )
+    parser.add_argument(
+        "--robot.id",
+        "--robot_id",
+        dest="robot_id",
+        type=str,
+        default="my_alohamini",
+        help="Robot ID",
+    )
+    parser.add_argument(
+        "--robot.robot_model",
+        "--robot_model",
+        dest="robot_model",
+        type=str,
+        default="alohamini1",
+        choices=["alohamini1", "alohamini2", "alohamini2pro"],
+        help="AlohaMini model. Must match the --robot_model used on the Pi host side.",
+    )
+    parser.add_argument(
+        "--teleop.id",
+        "--leader_id",
+        dest="leader_id",
+        type=str,
+        default="so101_leader_bi",
+        help="Leader arm device ID",
+    )
+    parser.add_argument(
+        "--teleop.arm_profile",
+        "--arm_profile",
+        dest="arm_profile",
+        type=str,
+        default="so-arm-5dof",
+        choices=["so-arm-5dof", "am-leader-6dof"],
+        help="Leader arm profile selector.",
+    )
+    return parser.parse_args()
+
+
+def run_teleop(args):
+    """Single parametrized teleop loop — keep all hot-path tuning in this one place."""
+    no_robot = args.no_robot
+    no_leader = args.no_leader
+    fps = args.fps
+    verbose = args.verbose
+
+    if args.rt:
+        # Removes scheduler-induced jitter: the loop preempts background Python
+        # threads (log drain, Rerun) instead of sharing a core with them.
+        if request_realtime_scheduling(priority=80, core=args.rt_core):
+            print(f"⏱️ Real-time scheduling enabled (SCHED_FIFO, pinned to core {args.rt_core}).")
+        else:
+            print("⚠️ Real-time scheduling unavailable (needs root or CAP_SYS_NICE); running with default scheduling.")
+
+    if no_robot:
+        print("🧪 NO_ROBOT mode enabled: robot will not connect, only print actions.")
+
+    if no_leader:
+        print("🧪 NO_LEADER mode enabled: leader arm will not connect, only print actions.")
+    # Create configs
+    robot_config = AlohaMiniClientConfig(
+        remote_ip=args.remote_ip,
+        id=args.robot_id,
+        robot_model=args.robot_model,
+    )
+    bi_cfg = BiSOLeaderConfig(
+        left_arm_config=SOLeaderConfig(
+            port="/dev/am_arm_leader_left",
+            arm_profile=args.arm_profile,
+        ),
+        right_arm_config=SOLeaderConfig(
+            port="/dev/am_arm_leader_right",
+            arm_profile=args.arm_profile,
+        ),
+        id=args.leader_id,
+    )
+    leader = BiSOLeader(bi_cfg)
+    keyboard_config = KeyboardTeleopConfig(id="my_laptop_keyboard")
+    keyboard = KeyboardTeleop(keyboard_config)
+    robot = AlohaMiniClient(robot_config)
+
+    # Connection logic
+    if not no_robot:
+        robot.connect()
+    else:
+        print("🧪 robot.connect() skipped, only printing actions.")
+
+    if not no_leader:
+        leader.connect()
     else:
-        print(f"[fps={loop_fps:.1f}] Sent action → {action}")
+        print("🧪 leader.connect() skipped, only printing actions.")
+
+    keyboard.connect()
+
+    init_rerun(session_name="alohamini_teleop")
+
+    if not robot.is_connected or not leader.is_connected or not keyboard.is_connected:
+        print("⚠️ Warning: Some devices are not connected! Still running for debug.")
+
+    # Pre-warm: the first read on each device pays one-time costs (serial register
+    # caches, transport buffers, JPEG decoder setup) that would otherwise land as a
+    # visible stutter on frame 0. Reads only — no dummy action is sent.
+    if not no_leader:
+        leader.get_action()
+    if not no_robot:
+        robot.get_observation()
+
+    # Preallocate the action dict once. Rebuilding it every frame allocates several
+    # transient dicts and runs an f-string format per joint at FPS=30+; instead the
+    # "arm_"-prefixed keys are formatted here and values are updated in place.
+    arm_prefixed_keys = {k: f"arm_{k}" for k in leader.action_features}
+    base_keys = ("x.vel", "y.vel", "theta.vel")
+    lift_keys = ("lift_axis.height_mm", "lift_axis.vel")
+    action = dict.fromkeys(
+        ([] if no_leader else list(arm_prefixed_keys.values())) + list(base_keys + lift_keys), 0.0
+    )
+
+    # Printing the full action dict every frame holds the GIL for ~20 float formats
+    # and a blocking stdout write — milliseconds of jitter on a 33 ms budget. The
+    # loop only appends a snapshot to a bounded ring; a daemon thread drains the
+    # newest entry and prints at most twice per second.
+    log_q = deque(maxlen=256)
+
+    def _drain_log_queue():
+        tag = "[NO_ROBOT] action" if no_robot else "Sent action"
+        while True:
+            if log_q:
+                loop_fps, action_snapshot = log_q.pop()
+                log_q.clear()
+                print(f"[fps={loop_fps:.1f}] {tag} → {action_snapshot}")
+            time.sleep(0.5)
+
+    if verbose:
+        threading.Thread(target=_drain_log_queue, daemon=True).start()
+
+    # Rerun serialization and viewer IPC are not bounded and can block for longer
+    # than a frame budget. The loop only appends snapshots into a small drop-oldest
+    # ring; a daemon thread feeds the viewer, so a lagging viewer drops frames
+    # instead of stalling the control loop.
+    viz_q = deque(maxlen=4)
+
+    def _drain_viz_queue():
+        while True:
+            try:
+                observation_snapshot, action_snapshot = viz_q.popleft()
+            except IndexError:
+                time.sleep(0.005)
+                continue
+            log_rerun_data(observation_snapshot, action_snapshot)
+
+    threading.Thread(target=_drain_viz_queue, daemon=True).start()
+
+    # Absolute-deadline pacing: each frame targets `next_t += period` instead of
+    # re-measuring its own elapsed time, so timing errors do not accumulate over
+    # long sessions.
+    period = 1.0 / fps
+    next_t = time.perf_counter() + period
+
+    # Bind the hot-path callables once: each `a.b` in the loop body re-resolves the
+    # attribute every frame otherwise.
+    perf = time.perf_counter
+    get_observation = robot.get_observation
+    get_leader_action = leader.get_action
+    get_keyboard_action = keyboard.get_action
+    kb_to_base_action = robot._from_keyboard_to_base_action
+    kb_to_lift_action = robot._from_keyboard_to_lift_action
+    send_action = robot.send_action
+    push_viz = viz_q.append
+    push_log = log_q.append
+
+    # Main loop
+    while True:
+        t0 = perf()
+
+        if not no_leader:
+            arm_actions = get_leader_action()
+            for k, v in arm_actions.items():
+                action[arm_prefixed_keys[k]] = v
+        keyboard_keys = get_keyboard_action()
+        base_action = kb_to_base_action(keyboard_keys)
+        lift_action = kb_to_lift_action(keyboard_keys)
+
+        action.update(base_action)
+        action.update(lift_action)
+        # `lift_axis.vel` is only emitted on some frames; a stale zero left in the
+        # reused dict would override the height target on the host side.
+        if "lift_axis.vel" not in lift_action:
+            action.pop("lift_axis.vel", None)
+
+        if not no_robot:
+            send_action(action)
+
+        # Fetch the observation after the action is on the wire: the action only
+        # depends on leader/keyboard input, so the observation round-trip (and JPEG
+        # decode) overlaps the host applying the command instead of delaying it.
+        # The client's bounded request window keeps responses pipelined underneath.
+        observation = get_observation() if not no_robot else {}
+        push_viz((observation, dict(action)))
+
+        remaining = next_t - perf()
+        if remaining < -period:
+            # Missed the deadline by more than a full frame: resync instead of
+            # spinning through a backlog of overdue deadlines.
+            print(f"[teleop] Missed frame deadline by {-remaining * 1e3:.1f} ms, resyncing.")
+            next_t = perf() + period
+        else:
+            precise_sleep_until(next_t)
+            next_t += period
+        loop_dt = perf() - t0
+        loop_fps = 1.0 / loop_dt if loop_dt > 0 else float("inf")
+
+        if verbose:
+            push_log((loop_fps, dict(action)))
+
+
+if __name__ == "__main__":
+    run_teleop(parse_args())
@@ -1,3 +1,4 @@
+import numpy as np
 from datasets import load_dataset
 
 # 1. Read parquet directly as a Dataset (train split)
@@ -10,14 +11,17 @@ ds = load_dataset(
 # 2. Inspect columns
 print("columns:", ds.column_names)
 
-# 3. Print a few rows to confirm
-df = ds.to_pandas()
-print(df.head())
+# 3. Print a few rows to confirm (only materialize those rows, not the whole
+# episode — with camera columns a full to_pandas() can allocate hundreds of MB)
+print(ds.select(range(min(5, ds.num_rows))).to_pandas())
 
 # 4. Use a loose threshold to filter timestamps near 8.63s
+# Vectorized mask over the column instead of ds.filter(lambda ...), which runs a
+# Python callback per row.
 targ = 8.63
 tol  = 1                    # 1 ms tolerance
-ds_8_63 = ds.filter(lambda ex: abs(ex["timestamp"] - targ) < tol)
+ts = np.asarray(ds["timestamp"])
+ds_8_63 = ds.select(np.flatnonzero(np.abs(ts - targ) < tol))
 
 print(f"Matched rows: {ds_8_63.num_rows}")
 for ex in ds_8_63:
@@ -44,8 +44,10 @@ def record_3s_wav(device_idx, samplerate=16000, channels=1):
     print(f"[diag] 开始录音… 设备={device_idx}, 采样率={samplerate}Hz, 通道={channels}")
     audio = sd.rec(int(3 * samplerate), samplerate=samplerate, channels=channels, dtype="int16")
     sd.wait()
-    # Compute RMS
-    rms = float(np.sqrt(np.mean((audio.astype(np.float32) / 32768.0) ** 2)) + 1e-12)
+    # Compute RMS. Square in int32 (numpy's integer SIMD kernels) and normalize once,
+    # instead of converting every sample to float32 first.
+    mean_sq = float(np.mean(audio.astype(np.int32) ** 2, dtype=np.float64)) / (32768.0**2)
+    rms = math.sqrt(mean_sq) + 1e-12
     dbfs = 20 * math.log10(rms)
     print(f"[diag] 3秒录音完成。RMS={rms:.6f}, 约 {dbfs:.1f} dBFS（<-60 dBFS 往往表示太小/静音/麦克风静音）")
     # Write wav file
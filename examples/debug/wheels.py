@@ -14,6 +14,8 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import logging
+import threading
 import time
 
 import numpy as np
@@ -22,6 +24,8 @@ from pynput import keyboard
 from lerobot.motors import Motor, MotorNormMode
 from lerobot.motors.feetech import FeetechMotorsBus, OperatingMode
 
+logger = logging.getLogger(__name__)
+
 # ------------------------ Global constants (edit here) ------------------------ #
 DEFAULT_PORT: str = "/dev/ttyACM0"
 MODEL: str = "sts3215"  # Feetech model
@@ -33,6 +37,7 @@ ANG_SPEED: float = 80.0  # Angular speed (deg/s)
 WHEEL_RADIUS: float = 0.05  # Wheel radius (m)
 BASE_RADIUS: float = 0.125  # Wheel-to-center distance (m)
 MAX_RAW: int = 3000  # Raw speed limit (scaled)
+LOOP_HZ: float = 20.0  # Teleop loop rate
 
 
 # def degps_to_raw(degps: float) -> int:
@@ -61,8 +66,35 @@ def raw_to_degps(raw_speed: int) -> float:
     return -degps if (raw_speed & 0x8000) else degps
 
 
+def raw_to_degps_vec(raw: np.ndarray) -> np.ndarray:
+    """Vectorized raw_to_degps (bit15 carries the sign, as in the wire format)."""
+    raw = np.asarray(raw, dtype=np.int64)
+    degps = (raw & 0x7FFF) / (4096.0 / 360.0)
+    return np.where(raw & 0x8000, -degps, degps)
+
+
 # ------------------------ Kinematics (equilateral tri-wheel, 120 deg) ------------------------ #
 
+# Fixed geometry, computed once at import: rebuilding the 3x3 mixer matrix (and
+# inverting it) on every call is pure per-tick overhead in the teleop loop.
+# Wheel mounting angles are defined clockwise from +y: left=300°, back=180°, right=60°.
+_STEPS_PER_DEG = 4096.0 / 360.0
+_DEG2RAD = np.pi / 180.0
+_RAD2DEG = 180.0 / np.pi
+_ANGLES = np.radians(np.array([240, 0, 120]) - 90)
+_M = np.column_stack([np.cos(_ANGLES), np.sin(_ANGLES), np.full(3, BASE_RADIUS)])
+_M_INV = np.linalg.inv(_M)
+# Scratch buffer for the body-velocity vector, filled in place each call to
+# avoid a fresh allocation per tick. Makes body_to_wheel_raw non-reentrant,
+# which is fine for the single-threaded teleop loop.
+_VEL = np.empty(3)
+
+
+def _mixer(base_radius: float) -> np.ndarray:
+    if base_radius == BASE_RADIUS:
+        return _M
+    return np.column_stack([np.cos(_ANGLES), np.sin(_ANGLES), np.full(3, base_radius)])
+
 
 def body_to_wheel_raw(
     x_cmd: float,
@@ -77,27 +109,25 @@ def body_to_wheel_raw(
     Args: x_cmd/y_cmd in m/s; theta_cmd_degps in deg/s.
     Wheel mounting angles are defined clockwise from +y: left=300°, back=180°, right=60°.
     Returns dict: left_wheel/back_wheel/right_wheel.
+    Not reentrant: fills a shared module-level scratch buffer.
     """
-    theta_rad = theta_cmd_degps * (np.pi / 180.0)
-    vel = np.array([-x_cmd, -y_cmd, theta_rad])
-
-    # angles = np.radians(np.array([300, 180, 60]))
-    angles = np.radians(np.array([240, 0, 120]) - 90)
-    M = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
-
-    v_lin = M.dot(vel)  # m/s
-    w_rad = v_lin / wheel_radius  # rad/s
-    w_degps = w_rad * (180.0 / np.pi)  # °/s
-
-    # Scale to avoid exceeding raw limits.
-    steps_per_deg = 4096.0 / 360.0
-    raw_abs = np.abs(w_degps) * steps_per_deg
-    peak = float(np.max(raw_abs)) if raw_abs.size else 0.0
-    if peak > max_raw and peak > 1e-6:
-        w_degps = w_degps * (max_raw / peak)
-
-    raw = [degps_to_raw(v) for v in w_degps]
-    print(f"raw:{raw}")
+    _VEL[0] = -x_cmd
+    _VEL[1] = -y_cmd
+    _VEL[2] = theta_cmd_degps * _DEG2RAD
+
+    # m/s per wheel -> rad/s -> °/s in one fused scale
+    w_degps = _mixer(base_radius).dot(_VEL) * (_RAD2DEG / wheel_radius)
+
+    # Single pass over the magnitudes: scale to the raw limit, round, re-sign.
+    # Peak-scaling to max_raw already bounds the values, so no extra
+    # 0x7FFF clip is needed.
+    mag = np.abs(w_degps) * _STEPS_PER_DEG
+    peak = float(mag.max())
+    if peak > max_raw:
+        mag *= max_raw / peak
+    mag = np.rint(mag).astype(np.int32)
+    raw = np.where(w_degps < 0, -mag, mag).tolist()
+    logger.debug("raw: %s", raw)
     return {"left_wheel": raw[0], "back_wheel": raw[1], "right_wheel": raw[2]}
 
 
@@ -105,19 +135,18 @@ def wheel_raw_to_body(
     wheel_raw: dict[str, int], *, wheel_radius: float = WHEEL_RADIUS, base_radius: float = BASE_RADIUS
 ) -> tuple[float, float, float]:
     raw_list = [int(wheel_raw.get(n, 0)) for n in ("left_wheel", "back_wheel", "right_wheel")]
-    w_degps = np.array([raw_to_degps(r) for r in raw_list])
-    w_rad = w_degps * (np.pi / 180.0)
+    w_degps = raw_to_degps_vec(raw_list)
+    w_rad = w_degps * _DEG2RAD
     v_lin = w_rad * wheel_radius
 
-    # angles = np.radians(np.array([300, 180, 60]))
-    angles = np.radians(np.array([240, 0, 120]) - 90)
-
-    M = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
-    M_inv = np.linalg.inv(M)
-    x_cmd, y_cmd, theta_rad = M_inv.dot(v_lin)
+    if base_radius == BASE_RADIUS:
+        x_cmd, y_cmd, theta_rad = _M_INV.dot(v_lin)
+    else:
+        # solve() beats inv()+dot for a one-off matrix, in speed and conditioning.
+        x_cmd, y_cmd, theta_rad = np.linalg.solve(_mixer(base_radius), v_lin)
     x_cmd = -x_cmd
     y_cmd = -y_cmd
-    theta_cmd_degps = theta_rad * (180.0 / np.pi)
+    theta_cmd_degps = theta_rad * _RAD2DEG
     return x_cmd, y_cmd, theta_cmd_degps
 
 
@@ -144,10 +173,20 @@ class OmniTeleop:
         self.bus = FeetechMotorsBus(port=port, motors=self.motors)
         self.running = True
         self.pressed = dict.fromkeys(TELEOP_KEYS, False)
+        # Edge-triggered command updates: the listener thread flags key-state
+        # changes and the run loop only recomputes wheel commands when flagged.
+        self._pressed_lock = threading.Lock()
+        self._dirty = threading.Event()
 
         self.lin_speed = float(LIN_SPEED)
         self.ang_speed = float(ANG_SPEED)
 
+        # Last commanded wheel velocities: identical commands (e.g. a held key) are
+        # not re-sent every tick, only as a once-per-second keep-alive.
+        self._last_cmds: dict[str, int] | None = None
+        self._last_write_ts = 0.0
+        self._tick = 0
+
     # ---- Keyboard events ----
     def _on_press(self, key):
         try:
@@ -163,7 +202,9 @@ class OmniTeleop:
                 if action == "quit":
                     self.running = False
                 else:
-                    self.pressed[action] = True
+                    with self._pressed_lock:
+                        self.pressed[action] = True
+                    self._dirty.set()
 
     def _on_release(self, key):
         try:
@@ -174,7 +215,9 @@ class OmniTeleop:
             return
         for action, bind in TELEOP_KEYS.items():
             if ch == bind and action in self.pressed:
-                self.pressed[action] = False
+                with self._pressed_lock:
+                    self.pressed[action] = False
+                self._dirty.set()
 
     # ---- Connect and mode switch ----
     def connect(self) -> None:
@@ -195,9 +238,7 @@ class OmniTeleop:
 
     def stop(self):
         try:
-            names = list(self.motors.keys())
-            zeros = [0, 0, 0]
-            self.bus.write("Goal_Velocity", zeros, names)
+            self.bus.sync_write("Goal_Velocity", dict.fromkeys(self.motors, 0), normalize=False)
         except Exception:
             pass
 
@@ -211,49 +252,74 @@ class OmniTeleop:
     def run(self):
         listener = keyboard.Listener(on_press=self._on_press, on_release=self._on_release)
         listener.start()
+        # Absolute-deadline pacing: sleep() alone drifts and jitters by ~1 ms on
+        # Linux, so we sleep to within 500 us of the deadline and spin the rest.
+        period_ns = int(1e9 / LOOP_HZ)
+        deadline = time.monotonic_ns() + period_ns
+        wheel_cmds = body_to_wheel_raw(0.0, 0.0, 0.0)
         try:
             while self.running:
-                x = (
-                    self.lin_speed
-                    if self.pressed.get("forward")
-                    else (-self.lin_speed if self.pressed.get("backward") else 0.0)
-                )
-                y = (
-                    self.lin_speed
-                    if self.pressed.get("left")
-                    else (-self.lin_speed if self.pressed.get("right") else 0.0)
-                )
-                th = (
-                    self.ang_speed
-                    if self.pressed.get("rotate_left")
-                    else (-self.ang_speed if self.pressed.get("rotate_right") else 0.0)
-                )
-
-                wheel_cmds = body_to_wheel_raw(x, y, th)
+                # Only recompute commands on a key-state edge; on a held key the
+                # tick reduces to watchdog/keep-alive work.
+                if self._dirty.is_set():
+                    self._dirty.clear()
+                    with self._pressed_lock:
+                        pressed = dict(self.pressed)
+                    x = (
+                        self.lin_speed
+                        if pressed.get("forward")
+                        else (-self.lin_speed if pressed.get("backward") else 0.0)
+                    )
+                    y = (
+                        self.lin_speed
+                        if pressed.get("left")
+                        else (-self.lin_speed if pressed.get("right") else 0.0)
+                    )
+                    th = (
+                        self.ang_speed
+                        if pressed.get("rotate_left")
+                        else (-self.ang_speed if pressed.get("rotate_right") else 0.0)
+                    )
+                    wheel_cmds = body_to_wheel_raw(x, y, th)
                 names: list[str] = list(self.motors.keys())
-                raw_vals = [wheel_cmds[n] for n in names]
-                for name, val in zip(names, raw_vals):
-                    self.bus.write("Goal_Velocity", name, val, normalize=False)
-
-                try:
-                    currents_raw = {
-                        name: self.bus.read("Present_Current", name, normalize=False) for name in names
-                    }
-                    currents_ma = {name: currents_raw[name] * 6.5 for name in names}
-                    ids = {name: self.motors[name].id for name in names}
-                    print(
-                        "Current(mA) left(id={left_id})={left_wheel:.1f} "
-                        "back(id={back_id})={back_wheel:.1f} right(id={right_id})={right_wheel:.1f}".format(
-                            left_id=ids["left_wheel"],
-                            back_id=ids["back_wheel"],
-                            right_id=ids["right_wheel"],
-                            **currents_ma,
+                # One sync_write/sync_read packet for all three wheels instead of
+                # six per-motor serial round-trips per tick.
+                now = time.monotonic()
+                if wheel_cmds != self._last_cmds or now - self._last_write_ts > 1.0:
+                    self.bus.sync_write("Goal_Velocity", wheel_cmds, normalize=False)
+                    self._last_cmds = wheel_cmds
+                    self._last_write_ts = now
+
+                # Current diagnostics once per second; per-tick formatting and
+                # stdout writes otherwise dominate the loop on a Pi.
+                self._tick += 1
+                if self._tick % 20 == 0:
+                    try:
+                        currents_raw = self.bus.sync_read("Present_Current", names, normalize=False)
+                        currents_ma = {name: currents_raw[name] * 6.5 for name in names}
+                        ids = {name: self.motors[name].id for name in names}
+                        print(
+                            "Current(mA) left(id={left_id})={left_wheel:.1f} "
+                            "back(id={back_id})={back_wheel:.1f} right(id={right_id})={right_wheel:.1f}".format(
+                                left_id=ids["left_wheel"],
+                                back_id=ids["back_wheel"],
+                                right_id=ids["right_wheel"],
+                                **currents_ma,
+                            )
                         )
-                    )
-                except Exception as exc:
-                    print(f"Current read failed: {exc}")
-
-                time.sleep(0.05)
+                    except Exception as exc:
+                        print(f"Current read failed: {exc}")
+
+                deadline += period_ns
+                slack = deadline - time.monotonic_ns()
+                if slack < -period_ns:
+                    # More than one period behind: drop the missed tick(s) and resync.
+                    logger.warning("Teleop loop overran by %.1f ms; resyncing", -slack / 1e6)
+                    deadline = time.monotonic_ns()
+                elif slack > 1_000_000:
+                    time.sleep((slack - 500_000) / 1e9)
+                while time.monotonic_ns() < deadline:
+                    pass
         except KeyboardInterrupt:
             pass
         finally:
@@ -122,6 +122,13 @@ class AlohaMini(Robot):
         lm = specs["lift_motor"]
         self.wheel_radius = specs["wheel_radius"]
         self.base_radius = specs["base_radius"]
+        # Base kinematics are fixed by the robot model; build the mixer matrix
+        # and its inverse once instead of rebuilding (and inverting) per call.
+        # Wheel mounting angles are defined with a -90 degree offset.
+        angles = np.radians(np.array([240, 0, 120]) - 90)
+        self._kinematic_angles = angles
+        self._kinematic_m = np.column_stack([np.cos(angles), np.sin(angles), np.full(3, self.base_radius)])
+        self._kinematic_m_inv = np.linalg.inv(self._kinematic_m)
 
         left_arm_motors_cfg = _make_arm_motors("arm_left", arm_profile, norm_mode_body)
         right_arm_motors_cfg = _make_arm_motors("arm_right", arm_profile, norm_mode_body)
@@ -526,11 +533,13 @@ class AlohaMini(Robot):
         # Create the body velocity vector [x, y, theta_rad].
         velocity_vector = np.array([-x, -y, theta_rad])
 
-        # Define the wheel mounting angles with a -90° offset.
-        angles = np.radians(np.array([240, 0, 120]) - 90)
-        # Build the kinematic matrix: each row maps body velocities to a wheel’s linear speed.
+        # Kinematic matrix: each row maps body velocities to a wheel’s linear speed.
         # The third column (base_radius) accounts for the effect of rotation.
-        m = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
+        if base_radius == self.base_radius:
+            m = self._kinematic_m
+        else:
+            a = self._kinematic_angles
+            m = np.column_stack([np.cos(a), np.sin(a), np.full(3, base_radius)])
 
         # Compute each wheel’s linear speed (m/s) and then its angular speed (rad/s).
         wheel_linear_speeds = m.dot(velocity_vector)
@@ -592,13 +601,15 @@ class AlohaMini(Robot):
         # Compute each wheel’s linear speed (m/s) from its angular speed.
         wheel_linear_speeds = wheel_radps * wheel_radius
 
-        # Define the wheel mounting angles with a -90° offset.
-        angles = np.radians(np.array([240, 0, 120]) - 90)
-        m = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
-
         # Solve the inverse kinematics: body_velocity = M⁻¹ · wheel_linear_speeds.
-        m_inv = np.linalg.inv(m)
-        velocity_vector = m_inv.dot(wheel_linear_speeds)
+        # Use the precomputed inverse for the model geometry; np.linalg.solve is
+        # both faster and better conditioned than inv() for a one-off radius.
+        if base_radius == self.base_radius:
+            velocity_vector = self._kinematic_m_inv.dot(wheel_linear_speeds)
+        else:
+            a = self._kinematic_angles
+            m = np.column_stack([np.cos(a), np.sin(a), np.full(3, base_radius)])
+            velocity_vector = np.linalg.solve(m, wheel_linear_speeds)
         x, y, theta_rad = velocity_vector
         
         theta = theta_rad * (180.0 / np.pi)
@@ -89,6 +89,17 @@ class AlohaMiniClient(Robot):
         ]
         self.speed_index = 0  # Start at slow
 
+        # Static key -> unit (x, y, theta) direction table for the base teleop:
+        # one dict lookup per pressed key instead of a branch per binding.
+        self._kb_base_lut = {
+            self.teleop_keys["forward"]: (1.0, 0.0, 0.0),
+            self.teleop_keys["backward"]: (-1.0, 0.0, 0.0),
+            self.teleop_keys["left"]: (0.0, 1.0, 0.0),
+            self.teleop_keys["right"]: (0.0, -1.0, 0.0),
+            self.teleop_keys["rotate_left"]: (0.0, 0.0, 1.0),
+            self.teleop_keys["rotate_right"]: (0.0, 0.0, -1.0),
+        }
+
         self._is_connected = False
         self.logs = {}
 
@@ -448,28 +459,20 @@ class AlohaMiniClient(Robot):
         xy_speed = speed_setting["xy"]  # e.g. 0.1, 0.25, or 0.4
         theta_speed = speed_setting["theta"]  # e.g. 30, 60, or 90
 
-        x_cmd = 0.0  # m/s forward/backward
-        y_cmd = 0.0  # m/s lateral
-        theta_cmd = 0.0  # deg/s rotation
-
-        if self.teleop_keys["forward"] in pressed_keys:
-            x_cmd += xy_speed
-        if self.teleop_keys["backward"] in pressed_keys:
-            x_cmd -= xy_speed
-        if self.teleop_keys["left"] in pressed_keys:
-            y_cmd += xy_speed
-        if self.teleop_keys["right"] in pressed_keys:
-            y_cmd -= xy_speed
-        if self.teleop_keys["rotate_left"] in pressed_keys:
-            theta_cmd += theta_speed
-        if self.teleop_keys["rotate_right"] in pressed_keys:
-            theta_cmd -= theta_speed
-
+        # Accumulate unit directions from the lookup table, then scale once.
+        x_dir = y_dir = theta_dir = 0.0
+        lut = self._kb_base_lut
+        for key in pressed_keys:
+            direction = lut.get(key)
+            if direction is not None:
+                x_dir += direction[0]
+                y_dir += direction[1]
+                theta_dir += direction[2]
 
         return {
-            "x.vel": x_cmd,
-            "y.vel": y_cmd,
-            "theta.vel": theta_cmd,
+            "x.vel": x_dir * xy_speed,  # m/s forward/backward
+            "y.vel": y_dir * xy_speed,  # m/s lateral
+            "theta.vel": theta_dir * theta_speed,  # deg/s rotation
         }
     
     # lift_axis.vel
@@ -41,6 +41,8 @@ class LiftAxisConfig:
     dir_sign: int = -1               # +1 no inversion; -1 invert direction
     step_mm: float = 2              # Step per key press (mm)
 
+    debug: bool = False              # Per-tick debug prints (off the hot path by default)
+
 
 
 class LiftAxis:
@@ -55,14 +57,20 @@ class LiftAxis:
         self._bus = (bus_left if cfg.bus == "left" else bus_right)
         self.enabled = bool(cfg.enabled and self._bus is not None)
         self._ticks_per_rev = 4096.0
-        self._deg_per_tick = 360.0 / self._ticks_per_rev
-        self._mm_per_deg = (cfg.lead_mm_per_rev * cfg.output_gear_ratio) / 360.0
+        # dir_sign * deg-per-tick * mm-per-deg folded into one constant:
+        # height_mm = extended_ticks * _mm_per_tick_signed - _z0_mm
+        self._mm_per_tick_signed = cfg.dir_sign * cfg.lead_mm_per_rev * cfg.output_gear_ratio / 4096.0
 
         # Multi-turn tick tracking
         self._last_tick: float = 0.0
         self._extended_ticks: float = 0.0  # cumulative total
-        # Zero reference (extended angle)
-        self._z0_deg: float = 0.0
+        # Zero reference (mm)
+        self._z0_mm: float = 0.0
+
+        # Last computed height, shared between observation and action within a
+        # control tick so each tick pays for a single position read.
+        self._last_height_mm: float = 0.0
+        self._last_height_t: float = float("-inf")
 
         self._configured = False
 
@@ -89,14 +97,17 @@ class LiftAxis:
         self._extended_ticks += delta
         self._last_tick = cur
 
-    def _extended_deg(self) -> float:
-        return self.cfg.dir_sign * self._extended_ticks * self._deg_per_tick 
-
-    def get_height_mm(self) -> float:
+    def get_height_mm(self, max_age_s: float = 0.0) -> float:
+        """Current height in mm. With max_age_s > 0, a height computed within
+        that window (by any reader) is reused instead of hitting the bus again,
+        so observation and action share one read per control tick."""
         if not self.enabled: return 0.0
+        if max_age_s > 0.0 and (time.perf_counter() - self._last_height_t) <= max_age_s:
+            return self._last_height_mm
         self._update_extended_ticks()
-        raw_mm = (self._extended_deg() - self._z0_deg) * self._mm_per_deg
-        #print(f"[lift_axis.get_height_mm] raw_mm={raw_mm:.2f}, extended_deg={self._extended_deg():.2f}, z0_deg={self._z0_deg:.2f}")  # debug
+        raw_mm = self._extended_ticks * self._mm_per_tick_signed - self._z0_mm
+        self._last_height_mm = raw_mm
+        self._last_height_t = time.perf_counter()
         return raw_mm
     
     # Homing (down to hard stop → rebound, set z=0mm)
@@ -105,10 +116,12 @@ class LiftAxis:
         self.configure()
         name = self.cfg.name
         # Move downward
-        v_down = self.cfg.home_down_speed 
+        v_down = self.cfg.home_down_speed
         self._bus.write("Goal_Velocity", name, v_down)
         stuck = 0
-        last_tick = int(self._bus.read("Present_Position", name, normalize=False))
+        # configure() just seeded the tick tracker; reuse it instead of paying
+        # another serial round-trip for the same register.
+        last_tick = self._last_tick
         for _ in range(600):  # ~30s @50ms
             time.sleep(0.05)
             self._update_extended_ticks()
@@ -121,12 +134,14 @@ class LiftAxis:
                 try: 
                     raw_cur_ma = int(self._bus.read("Present_Current", name, normalize=False))
                     cur_ma = raw_cur_ma * 6.5
-                    print(f"[lift_axis.home] Present_Current={cur_ma} mA")  # debug
-                    print(f"[lift_axis.home] Present_Position={now_tick} ticks")  # debug
+                    if self.cfg.debug:
+                        print(f"[lift_axis.home] Present_Current={cur_ma} mA")  # debug
+                        print(f"[lift_axis.home] Present_Position={now_tick} ticks")  # debug
 
                 except Exception: cur_ma = 0
             if (use_current and cur_ma >= self.cfg.home_stall_current_ma) or (not moved):
-                print(f"[lift_axis.home] Stalled at current={cur_ma} mA, moved={moved}")  # debug
+                if self.cfg.debug:
+                    print(f"[lift_axis.home] Stalled at current={cur_ma} mA, moved={moved}")  # debug
                 stuck += 1
             else:
                 stuck = 0
@@ -137,10 +152,10 @@ class LiftAxis:
         time.sleep(1)
 
         self._update_extended_ticks()
-        self._z0_deg = self._extended_deg()       
+        self._z0_mm = self._extended_ticks * self._mm_per_tick_signed
         print("Extended ticks after homing:", self._extended_ticks)
         h_now = self.get_height_mm()
-        print(f"[home] set-zero z0_deg={self._z0_deg:.2f}, height_now={h_now:.2f} mm")  # should be ~0 here
+        print(f"[home] set-zero z0_mm={self._z0_mm:.2f}, height_now={h_now:.2f} mm")  # should be ~0 here
 
 
 
@@ -149,10 +164,13 @@ class LiftAxis:
         """Export convenient observation fields: height_mm and velocity"""
         if not self.enabled: return
         obs[f"{self.cfg.name}.height_mm"] = self.get_height_mm()
-        try:
-            obs[f"{self.cfg.name}.vel"] = int(self._bus.read("Present_Velocity", self.cfg.name, normalize=False))
-        except Exception:
-            pass
+        # ".vel" is not part of the robot's observation features, so only pay
+        # for the extra serial round-trip when debugging.
+        if self.cfg.debug:
+            try:
+                obs[f"{self.cfg.name}.vel"] = int(self._bus.read("Present_Velocity", self.cfg.name, normalize=False))
+            except Exception:
+                pass
 
     def apply_action(self, action: Dict[str, float]) -> None:
         """
@@ -166,7 +184,7 @@ class LiftAxis:
         key_v = f"{self.cfg.name}.vel"
         if key_h in action:
             target_mm = float(action[key_h])
-            cur_mm = self.get_height_mm()
+            cur_mm = self.get_height_mm(max_age_s=0.05)
             err = target_mm - cur_mm
             if abs(err) <= self.cfg.on_target_mm:
                 v_cmd = 0
@@ -178,11 +196,12 @@ class LiftAxis:
                     v_cmd = -self.cfg.v_max
             # Descent floor guard
             if v_cmd < 0 and cur_mm <= self.cfg.descent_floor_mm:
-                print(
-                    f"[LiftAxis] Descent guard active: height {cur_mm:.1f} mm is at or below "
-                    f"the floor limit ({self.cfg.descent_floor_mm} mm). "
-                    "Downward motion blocked to prevent motor stall."
-                )
+                if self.cfg.debug:
+                    print(
+                        f"[LiftAxis] Descent guard active: height {cur_mm:.1f} mm is at or below "
+                        f"the floor limit ({self.cfg.descent_floor_mm} mm). "
+                        "Downward motion blocked to prevent motor stall."
+                    )
                 v_cmd = 0
             # Soft boundary limit
             if (cur_mm >= self.cfg.soft_max_mm and v_cmd > 0) or (
@@ -196,14 +215,15 @@ class LiftAxis:
             v = max(-self.cfg.v_max, min(self.cfg.v_max, v))
             # Limit if already at boundary
             try:
-                cur_mm = self.get_height_mm()
+                cur_mm = self.get_height_mm(max_age_s=0.05)
                 # Descent floor guard
                 if v < 0 and cur_mm <= self.cfg.descent_floor_mm:
-                    print(
-                        f"[LiftAxis] Descent guard active: height {cur_mm:.1f} mm is at or below "
-                        f"the floor limit ({self.cfg.descent_floor_mm} mm). "
-                        "Downward motion blocked to prevent motor stall."
-                    )
+                    if self.cfg.debug:
+                        print(
+                            f"[LiftAxis] Descent guard active: height {cur_mm:.1f} mm is at or below "
+                            f"the floor limit ({self.cfg.descent_floor_mm} mm). "
+                            "Downward motion blocked to prevent motor stall."
+                        )
                     v = 0
                 elif (cur_mm >= self.cfg.soft_max_mm and v > 0) or (cur_mm <= self.cfg.soft_min_mm and v < 0):
                     v = 0
@@ -72,6 +72,13 @@ class LeKiwi(Robot):
         )
         self.arm_motors = [motor for motor in self.bus.motors if motor.startswith("arm")]
         self.base_motors = [motor for motor in self.bus.motors if motor.startswith("base")]
+        # Base kinematics are fixed by the geometry; build the mixer matrix and
+        # its inverse once instead of rebuilding (and inverting) them per call.
+        # Wheel mounting angles are defined with a -90 degree offset.
+        angles = np.radians(np.array([240, 0, 120]) - 90)
+        self._kinematic_angles = angles
+        self._kinematic_m = np.column_stack([np.cos(angles), np.sin(angles), np.full(3, 0.125)])
+        self._kinematic_m_inv = np.linalg.inv(self._kinematic_m)
         depth_cameras = [name for name, cfg in config.cameras.items() if getattr(cfg, "use_depth", False)]
         if depth_cameras:
             raise NotImplementedError(
@@ -264,11 +271,13 @@ class LeKiwi(Robot):
         # Create the body velocity vector [x, y, theta_rad].
         velocity_vector = np.array([x, y, theta_rad])
 
-        # Define the wheel mounting angles with a -90° offset.
-        angles = np.radians(np.array([240, 0, 120]) - 90)
-        # Build the kinematic matrix: each row maps body velocities to a wheel’s linear speed.
+        # Kinematic matrix: each row maps body velocities to a wheel’s linear speed.
         # The third column (base_radius) accounts for the effect of rotation.
-        m = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
+        if base_radius == 0.125:
+            m = self._kinematic_m
+        else:
+            a = self._kinematic_angles
+            m = np.column_stack([np.cos(a), np.sin(a), np.full(3, base_radius)])
 
         # Compute each wheel’s linear speed (m/s) and then its angular speed (rad/s).
         wheel_linear_speeds = m.dot(velocity_vector)
@@ -328,13 +337,15 @@ class LeKiwi(Robot):
         # Compute each wheel’s linear speed (m/s) from its angular speed.
         wheel_linear_speeds = wheel_radps * wheel_radius
 
-        # Define the wheel mounting angles with a -90° offset.
-        angles = np.radians(np.array([240, 0, 120]) - 90)
-        m = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
-
         # Solve the inverse kinematics: body_velocity = M⁻¹ · wheel_linear_speeds.
-        m_inv = np.linalg.inv(m)
-        velocity_vector = m_inv.dot(wheel_linear_speeds)
+        # Use the precomputed inverse for the stock geometry; np.linalg.solve is
+        # both faster and better conditioned than inv() for a one-off radius.
+        if base_radius == 0.125:
+            velocity_vector = self._kinematic_m_inv.dot(wheel_linear_speeds)
+        else:
+            a = self._kinematic_angles
+            m = np.column_stack([np.cos(a), np.sin(a), np.full(3, base_radius)])
+            velocity_vector = np.linalg.solve(m, wheel_linear_speeds)
         x, y, theta_rad = velocity_vector
         theta = theta_rad * (180.0 / np.pi)
         return {
@@ -22,6 +22,11 @@ from functools import cached_property
 import cv2
 import numpy as np
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from lerobot.types import RobotAction, RobotObservation
 from lerobot.utils.constants import ACTION, OBS_STATE
 from lerobot.utils.decorators import check_if_already_connected, check_if_not_connected
@@ -76,6 +81,17 @@ class LeKiwiClient(Robot):
         ]
         self.speed_index = 0  # Start at slow
 
+        # Static key -> unit (x, y, theta) direction table for the base teleop:
+        # one dict lookup per pressed key instead of a branch per binding.
+        self._kb_base_lut = {
+            self.teleop_keys["forward"]: (1.0, 0.0, 0.0),
+            self.teleop_keys["backward"]: (-1.0, 0.0, 0.0),
+            self.teleop_keys["left"]: (0.0, 1.0, 0.0),
+            self.teleop_keys["right"]: (0.0, -1.0, 0.0),
+            self.teleop_keys["rotate_left"]: (0.0, 0.0, 1.0),
+            self.teleop_keys["rotate_right"]: (0.0, 0.0, -1.0),
+        }
+
         self._is_connected = False
         self.logs = {}
 
@@ -131,10 +147,14 @@ class LeKiwiClient(Robot):
         self.zmq_cmd_socket.connect(zmq_cmd_locator)
         self.zmq_cmd_socket.setsockopt(zmq.CONFLATE, 1)
 
-        self.zmq_observation_socket = self.zmq_context.socket(zmq.PULL)
+        # The host publishes observations on a PUB socket; subscribe to
+        # everything. CONFLATE does not support the multipart observation
+        # protocol; keep only-latest semantics with a high-water mark of one.
+        self.zmq_observation_socket = self.zmq_context.socket(zmq.SUB)
+        self.zmq_observation_socket.setsockopt(zmq.SUBSCRIBE, b"")
+        self.zmq_observation_socket.setsockopt(zmq.RCVHWM, 1)
         zmq_observations_locator = f"tcp://{self.remote_ip}:{self.port_zmq_observations}"
         self.zmq_observation_socket.connect(zmq_observations_locator)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
 
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
@@ -147,8 +167,8 @@ class LeKiwiClient(Robot):
     def calibrate(self) -> None:
         pass
 
-    def _poll_and_get_latest_message(self) -> str | None:
-        """Polls the ZMQ socket for a limited time and returns the latest message string."""
+    def _poll_and_get_latest_message(self) -> list[bytes] | None:
+        """Polls the ZMQ socket for a limited time and returns the latest message parts."""
         zmq = self._zmq
         poller = zmq.Poller()
         poller.register(self.zmq_observation_socket, zmq.POLLIN)
@@ -166,7 +186,7 @@ class LeKiwiClient(Robot):
         last_msg = None
         while True:
             try:
-                msg = self.zmq_observation_socket.recv_string(zmq.NOBLOCK)
+                msg = self.zmq_observation_socket.recv_multipart(zmq.NOBLOCK)
                 last_msg = msg
             except zmq.Again:
                 break
@@ -176,10 +196,23 @@ class LeKiwiClient(Robot):
 
         return last_msg
 
-    def _parse_observation_json(self, obs_string: str) -> RobotObservation | None:
-        """Parses the JSON observation string."""
+    def _parse_observation_meta(self, obs_payload: bytes | str) -> RobotObservation | None:
+        """Parses the observation meta payload (msgpack or JSON).
+
+        The host prefers msgpack when installed and falls back to JSON; a JSON
+        object always starts with '{' so the leading byte disambiguates.
+        """
+        if isinstance(obs_payload, bytes) and not obs_payload.startswith(b"{"):
+            if msgpack is None:
+                logging.error("Received a msgpack observation but msgpack is not installed.")
+                return None
+            try:
+                return msgpack.unpackb(obs_payload, raw=False)
+            except Exception as e:
+                logging.error(f"Error decoding msgpack observation: {e}")
+                return None
         try:
-            return json.loads(obs_string)
+            return json.loads(obs_payload)
         except json.JSONDecodeError as e:
             logging.error(f"Error decoding JSON observation: {e}")
             return None
@@ -199,8 +232,54 @@ class LeKiwiClient(Robot):
             logging.error(f"Error decoding base64 image data: {e}")
             return None
 
+    def _decode_image_from_jpeg_bytes(self, jpg_data: bytes) -> np.ndarray | None:
+        """Decodes JPEG bytes from a ZMQ multipart frame to an OpenCV image."""
+        if not jpg_data:
+            return None
+        frame = cv2.imdecode(np.frombuffer(jpg_data, np.uint8), cv2.IMREAD_COLOR)
+        if frame is None:
+            logging.warning("cv2.imdecode returned None for JPEG bytes.")
+        return frame
+
+    def _parse_observation_message(
+        self, message_parts: list[bytes]
+    ) -> tuple[RobotObservation, dict[str, np.ndarray]] | None:
+        """Parse either the multipart JPEG protocol or the legacy base64 JSON protocol."""
+        if not message_parts:
+            return None
+
+        observation = self._parse_observation_meta(message_parts[0])
+        if observation is None:
+            return None
+
+        current_frames: dict[str, np.ndarray] = {}
+        if len(message_parts) == 1:
+            # Backward compatibility with the previous JSON/base64 protocol.
+            for cam_name, image_b64 in observation.items():
+                if cam_name not in self._cameras_ft:
+                    continue
+                frame = self._decode_image_from_b64(image_b64)
+                if frame is not None:
+                    current_frames[cam_name] = frame
+        else:
+            if (len(message_parts) - 1) % 2 != 0:
+                logging.warning("Invalid multipart observation: expected camera/JPEG pairs.")
+            for index in range(1, len(message_parts) - 1, 2):
+                try:
+                    cam_name = message_parts[index].decode("utf-8")
+                except UnicodeDecodeError:
+                    logging.warning("Invalid camera name in multipart observation.")
+                    continue
+                if cam_name not in self._cameras_ft:
+                    continue
+                frame = self._decode_image_from_jpeg_bytes(message_parts[index + 1])
+                if frame is not None:
+                    current_frames[cam_name] = frame
+
+        return observation, current_frames
+
     def _remote_state_from_obs(
-        self, observation: RobotObservation
+        self, observation: RobotObservation, current_frames: dict[str, np.ndarray]
     ) -> tuple[dict[str, np.ndarray], RobotObservation]:
         """Extracts frames, and state from the parsed observation."""
 
@@ -210,15 +289,6 @@ class LeKiwiClient(Robot):
 
         obs_dict: RobotObservation = {**flat_state, OBS_STATE: state_vec}
 
-        # Decode images
-        current_frames: dict[str, np.ndarray] = {}
-        for cam_name, image_b64 in observation.items():
-            if cam_name not in self._cameras_ft:
-                continue
-            frame = self._decode_image_from_b64(image_b64)
-            if frame is not None:
-                current_frames[cam_name] = frame
-
         return current_frames, obs_dict
 
     def _get_data(self) -> tuple[dict[str, np.ndarray], RobotObservation]:
@@ -230,23 +300,24 @@ class LeKiwiClient(Robot):
         If no new data arrives or decoding fails, returns the last known values.
         """
 
-        # 1. Get the latest message string from the socket
-        latest_message_str = self._poll_and_get_latest_message()
+        # 1. Get the latest message parts from the socket
+        latest_message_parts = self._poll_and_get_latest_message()
 
         # 2. If no message, return cached data
-        if latest_message_str is None:
+        if latest_message_parts is None:
             return self.last_frames, self.last_remote_state
 
-        # 3. Parse the JSON message
-        observation = self._parse_observation_json(latest_message_str)
+        # 3. Parse the observation message
+        parsed = self._parse_observation_message(latest_message_parts)
 
-        # 4. If JSON parsing failed, return cached data
-        if observation is None:
+        # 4. If parsing failed, return cached data
+        if parsed is None:
             return self.last_frames, self.last_remote_state
+        observation, current_frames = parsed
 
         # 5. Process the valid observation data
         try:
-            new_frames, new_state = self._remote_state_from_obs(observation)
+            new_frames, new_state = self._remote_state_from_obs(observation, current_frames)
         except Exception as e:
             logging.error(f"Error processing observation data, serving last observation: {e}")
             return self.last_frames, self.last_remote_state
@@ -285,26 +356,20 @@ class LeKiwiClient(Robot):
         xy_speed = speed_setting["xy"]  # e.g. 0.1, 0.25, or 0.4
         theta_speed = speed_setting["theta"]  # e.g. 30, 60, or 90
 
-        x_cmd = 0.0  # m/s forward/backward
-        y_cmd = 0.0  # m/s lateral
-        theta_cmd = 0.0  # deg/s rotation
-
-        if self.teleop_keys["forward"] in pressed_keys:
-            x_cmd += xy_speed
-        if self.teleop_keys["backward"] in pressed_keys:
-            x_cmd -= xy_speed
-        if self.teleop_keys["left"] in pressed_keys:
-            y_cmd += xy_speed
-        if self.teleop_keys["right"] in pressed_keys:
-            y_cmd -= xy_speed
-        if self.teleop_keys["rotate_left"] in pressed_keys:
-            theta_cmd += theta_speed
-        if self.teleop_keys["rotate_right"] in pressed_keys:
-            theta_cmd -= theta_speed
+        # Accumulate unit directions from the lookup table, then scale once.
+        x_dir = y_dir = theta_dir = 0.0
+        lut = self._kb_base_lut
+        for key in pressed_keys:
+            direction = lut.get(key)
+            if direction is not None:
+                x_dir += direction[0]
+                y_dir += direction[1]
+                theta_dir += direction[2]
+
         return {
-            "x.vel": x_cmd,
-            "y.vel": y_cmd,
-            "theta.vel": theta_cmd,
+            "x.vel": x_dir * xy_speed,  # m/s forward/backward
+            "y.vel": y_dir * xy_speed,  # m/s lateral
+            "theta.vel": theta_dir * theta_speed,  # deg/s rotation
         }
 
     def configure(self):
@@ -14,16 +14,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import base64
+import contextlib
 import json
 import logging
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 import cv2
 import draccus
 import zmq
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    from turbojpeg import TJPF_BGR, TurboJPEG
+
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError):  # package or native libjpeg-turbo missing
+    _turbo_jpeg = None
+
 from .config_lekiwi import LeKiwiConfig, LeKiwiHostConfig
 from .lekiwi import LeKiwi
 
@@ -36,6 +51,33 @@ class LeKiwiServerConfig:
     host: LeKiwiHostConfig = field(default_factory=LeKiwiHostConfig)
 
 
+def encode_jpeg(frame, quality: int = 90) -> bytes | None:
+    """JPEG-encode a BGR frame, preferring libjpeg-turbo's SIMD path.
+
+    PyTurboJPEG is several times faster than OpenCV's default encoder on ARM;
+    cv2.imencode remains the fallback so the host runs without the optional
+    dependency. Returns None when encoding fails."""
+    if _turbo_jpeg is not None:
+        try:
+            return _turbo_jpeg.encode(frame, quality=quality, pixel_format=TJPF_BGR)
+        except Exception as e:
+            logging.warning("TurboJPEG encode failed, falling back to cv2: %s", e)
+    ret, buffer = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+    return buffer.tobytes() if ret else None
+
+
+def pack_observation_meta(meta: dict) -> bytes:
+    """Serialize the observation meta part, preferring msgpack when installed.
+
+    msgpack is binary-native and several times faster than json for mixed
+    float/str dicts; json remains the fallback so the wire stays usable without
+    the optional dependency. The client tells the two apart by the leading byte
+    (json objects always start with '{')."""
+    if msgpack is not None:
+        return msgpack.packb(meta, use_bin_type=True)
+    return json.dumps(meta).encode("utf-8")
+
+
 class LeKiwiHost:
     def __init__(self, config: LeKiwiHostConfig):
         self.zmq_context = zmq.Context()
@@ -43,8 +85,16 @@ class LeKiwiHost:
         self.zmq_cmd_socket.setsockopt(zmq.CONFLATE, 1)
         self.zmq_cmd_socket.bind(f"tcp://*:{config.port_zmq_cmd}")
 
-        self.zmq_observation_socket = self.zmq_context.socket(zmq.PUSH)
-        self.zmq_observation_socket.setsockopt(zmq.CONFLATE, 1)
+        self.cmd_poller = zmq.Poller()
+        self.cmd_poller.register(self.zmq_cmd_socket, zmq.POLLIN)
+
+        # PUB drops outright when no subscriber is connected instead of queueing
+        # and retrying like PUSH, and lets passive spectators (recorder, GUI)
+        # tap the stream without round-robin splitting. CONFLATE does not
+        # support multipart messages, so keep only-latest semantics with a
+        # high-water mark of one instead.
+        self.zmq_observation_socket = self.zmq_context.socket(zmq.PUB)
+        self.zmq_observation_socket.setsockopt(zmq.SNDHWM, 1)
         self.zmq_observation_socket.bind(f"tcp://*:{config.port_zmq_observations}")
 
         self.connection_time_s = config.connection_time_s
@@ -70,24 +120,95 @@ def main(cfg: LeKiwiServerConfig):
 
     last_cmd_time = time.time()
     watchdog_active = False
+
+    # JPEG encoding runs in a pool (OpenCV releases the GIL), one worker per
+    # camera, so frames compress in parallel instead of serially on the loop
+    # thread. A single sender thread drains a size-1 queue so the ZMQ send of
+    # tick N overlaps the capture of tick N+1; latest-wins on both the queue
+    # and the CONFLATE socket.
+    enc_pool = ThreadPoolExecutor(max_workers=max(1, len(robot.cameras)), thread_name_prefix="lekiwi_jpeg")
+    send_q: queue.Queue[list[bytes] | None] = queue.Queue(maxsize=1)
+
+    def send_worker():
+        while True:
+            payload = send_q.get()
+            if payload is None:
+                return
+            # PUB never blocks: with no subscriber or a full high-water mark
+            # the message is simply dropped.
+            host.zmq_observation_socket.send_multipart(payload)
+
+    def replace_latest(payload: list[bytes]) -> None:
+        """Put payload on the size-1 send queue, displacing any unsent one."""
+        with contextlib.suppress(queue.Empty):
+            send_q.get_nowait()
+        with contextlib.suppress(queue.Full):
+            send_q.put_nowait(payload)
+
+    send_thread = threading.Thread(target=send_worker, name="lekiwi_obs_send", daemon=True)
+    send_thread.start()
+
+    # Observation capture (camera grabs + motor reads, all I/O-bound) runs on
+    # its own thread so it overlaps the encode and send of the previous tick.
+    # The freshest observation is published by reference swap, atomic under
+    # the GIL. The motor bus is half-duplex serial, so a lock serializes bus
+    # access between capture and command dispatch.
+    robot_lock = threading.Lock()
+    obs_holder: list = [None]
+    obs_stop = threading.Event()
+
+    def obs_worker():
+        period_s = 1 / host.max_loop_freq_hz
+        while not obs_stop.is_set():
+            capture_start = time.perf_counter()
+            try:
+                with robot_lock:
+                    obs = robot.get_observation()
+            except Exception as e:
+                logging.error("Observation capture failed: %s", e)
+                obs_stop.wait(period_s)
+                continue
+            obs_holder[0] = obs
+            obs_stop.wait(max(0.0, period_s - (time.perf_counter() - capture_start)))
+
+    obs_thread = threading.Thread(target=obs_worker, name="lekiwi_obs_capture", daemon=True)
+    obs_thread.start()
+
     logging.info("Waiting for commands...")
     try:
         # Business logic
         start = time.perf_counter()
         duration = 0
+        # Absolute-deadline pacing: sleeping for `period - elapsed` accumulates
+        # drift and ~1 ms scheduler jitter per tick, so we sleep to within
+        # 500 us of an absolute deadline and spin the remainder.
+        period_ns = int(1e9 / host.max_loop_freq_hz)
+        deadline = time.monotonic_ns() + period_ns
+        last_encoded_observation = None
         while duration < host.connection_time_s:
-            loop_start_time = time.time()
-            try:
-                msg = host.zmq_cmd_socket.recv_string(zmq.NOBLOCK)
-                data = dict(json.loads(msg))
-                _action_sent = robot.send_action(data)
-                last_cmd_time = time.time()
-                watchdog_active = False
-            except zmq.Again:
-                if not watchdog_active:
-                    logging.warning("No command available")
-            except Exception as e:
-                logging.error("Message fetching failed: %s", e)
+            # Check for a pending command via the poller rather than paying for
+            # a zmq.Again exception on every empty tick.
+            events = dict(host.cmd_poller.poll(timeout=0))
+            if host.zmq_cmd_socket in events:
+                # Drain everything queued and act on the freshest command only,
+                # so the base never replays a backlog after a hiccup.
+                msg = None
+                while True:
+                    try:
+                        msg = host.zmq_cmd_socket.recv_string(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                if msg is not None:
+                    try:
+                        data = dict(json.loads(msg))
+                        with robot_lock:
+                            _action_sent = robot.send_action(data)
+                        last_cmd_time = time.time()
+                        watchdog_active = False
+                    except Exception as e:
+                        logging.error("Message fetching failed: %s", e)
+            elif not watchdog_active:
+                logging.warning("No command available")
 
             now = time.time()
             if (now - last_cmd_time > host.watchdog_timeout_ms / 1000) and not watchdog_active:
@@ -95,30 +216,48 @@ def main(cfg: LeKiwiServerConfig):
                     f"Command not received for more than {host.watchdog_timeout_ms} milliseconds. Stopping the base."
                 )
                 watchdog_active = True
-                robot.stop_base()
-
-            last_observation = robot.get_observation()
+                with robot_lock:
+                    robot.stop_base()
 
-            # Encode ndarrays to base64 strings
-            for cam_key, _ in robot.cameras.items():
-                ret, buffer = cv2.imencode(
-                    ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-                )
-                if ret:
-                    last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
-                else:
-                    last_observation[cam_key] = ""
-
-            # Send the observation to the remote agent
-            try:
-                host.zmq_observation_socket.send_string(json.dumps(last_observation), flags=zmq.NOBLOCK)
-            except zmq.Again:
-                logging.info("Dropping observation, no client connected")
+            # Encode only when the capture thread produced a new observation;
+            # re-encoding the same frames would burn the JPEG CPU this path
+            # exists to save.
+            last_observation = obs_holder[0]
+            if last_observation is not None and last_observation is not last_encoded_observation:
+                last_encoded_observation = last_observation
+                # JPEG-encode all cameras in parallel, then ship the raw bytes as
+                # multipart frames: [json_meta, cam_name, jpeg, cam_name, jpeg, ...].
+                # No base64 inflation, no JSON-escaping of binary data.
+                encode_futures = {
+                    cam_key: enc_pool.submit(encode_jpeg, last_observation[cam_key])
+                    for cam_key in robot.cameras
+                }
+                meta = {key: value for key, value in last_observation.items() if key not in robot.cameras}
+                meta["_image_encoding"] = "jpeg"
+                image_names = []
+                image_parts: list[bytes] = []
+                for cam_key, future in encode_futures.items():
+                    jpeg = future.result()
+                    if jpeg is None:
+                        logging.warning("Failed to JPEG encode camera frame %s.", cam_key)
+                        continue
+                    image_names.append(cam_key)
+                    image_parts.extend([cam_key.encode("utf-8"), jpeg])
+                meta["_images"] = image_names
 
-            # Ensure a short sleep to avoid overloading the CPU.
-            elapsed = time.time() - loop_start_time
+                # Hand the observation to the sender thread, replacing any unsent one
+                replace_latest([pack_observation_meta(meta), *image_parts])
 
-            time.sleep(max(1 / host.max_loop_freq_hz - elapsed, 0))
+            deadline += period_ns
+            slack = deadline - time.monotonic_ns()
+            if slack < -period_ns:
+                # More than one period behind: drop the missed tick(s) and resync.
+                logging.warning("Host loop overran by %.1f ms; resyncing", -slack / 1e6)
+                deadline = time.monotonic_ns()
+            elif slack > 1_000_000:
+                time.sleep((slack - 500_000) / 1e9)
+            while time.monotonic_ns() < deadline:
+                pass
             duration = time.perf_counter() - start
         print("Cycle time reached.")
 
@@ -126,6 +265,11 @@ def main(cfg: LeKiwiServerConfig):
         print("Keyboard interrupt received. Exiting...")
     finally:
         print("Shutting down Lekiwi Host.")
+        obs_stop.set()
+        obs_thread.join(timeout=1)
+        send_q.put(None)
+        send_thread.join(timeout=1)
+        enc_pool.shutdown(wait=False)
         robot.disconnect()
         host.disconnect()
 
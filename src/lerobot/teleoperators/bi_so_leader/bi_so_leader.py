@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 
 from lerobot.types import RobotAction
@@ -59,6 +60,11 @@ class BiSOLeader(BimanualMixin, Teleoperator):
         self.left_arm = SOLeader(left_arm_config)
         self.right_arm = SOLeader(right_arm_config)
 
+        # The two arms live on separate serial ports, so their bus round-trips can
+        # overlap. One worker reads the left arm while the calling thread reads the
+        # right one; pyserial releases the GIL while waiting on the port.
+        self._read_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bi_so_leader_read")
+
     @cached_property
     def action_features(self) -> dict[str, type]:
         left_arm_features = self.left_arm.action_features
@@ -79,14 +85,12 @@ class BiSOLeader(BimanualMixin, Teleoperator):
 
     @check_if_not_connected
     def get_action(self) -> RobotAction:
-        action_dict = {}
-
-        # Add "left_" prefix
-        left_action = self.left_arm.get_action()
-        action_dict.update({f"left_{key}": value for key, value in left_action.items()})
-
-        # Add "right_" prefix
+        left_future = self._read_pool.submit(self.left_arm.get_action)
         right_action = self.right_arm.get_action()
+        left_action = left_future.result()
+
+        # Add "left_"/"right_" prefixes
+        action_dict = {f"left_{key}": value for key, value in left_action.items()}
         action_dict.update({f"right_{key}": value for key, value in right_action.items()})
 
         return action_dict
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import platform
 import time
 
@@ -53,3 +54,51 @@ def precise_sleep(seconds: float, spin_threshold: float = 0.010, sleep_margin: f
     else:
         # On Linux time.sleep is accurate enough for most uses
         time.sleep(seconds)
+
+
+def precise_sleep_until(deadline: float, spin_threshold: float = 0.002, sleep_margin: float = 0.001):
+    """
+    Wait until ``time.perf_counter()`` reaches ``deadline``.
+
+    Intended for absolute-deadline pacing of periodic loops (``deadline += period`` each
+    frame), which does not accumulate the drift of re-measuring elapsed time every frame.
+    Sleeps for the bulk of the wait and spins only for the final ~1 ms, holding jitter low
+    without burning a CPU core.
+
+    Parameters:
+      - deadline: target ``time.perf_counter()`` value to return at
+      - spin_threshold: if remaining <= spin_threshold -> spin only. Default 2ms
+      - sleep_margin: when sleeping leave this much time before deadline to avoid oversleep. Default 1ms
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > spin_threshold:
+        time.sleep(remaining - sleep_margin)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def request_realtime_scheduling(priority: int = 80, core: int | None = None) -> bool:
+    """
+    Best-effort request for SCHED_FIFO real-time scheduling, optionally pinning the
+    calling thread to one CPU core so a control loop does not share its core with
+    background Python threads (loggers, visualization, ...).
+
+    Requires Linux and root or CAP_SYS_NICE; returns False without raising when the OS
+    refuses or does not support it. To grant the capability without running as root:
+    ``sudo setcap cap_sys_nice+ep $(readlink -f $(which python))``, or launch the script
+    through ``chrt -f <priority> python ...``.
+    """
+    if not hasattr(os, "sched_setscheduler"):
+        return False
+
+    ok = True
+    if core is not None:
+        try:
+            os.sched_setaffinity(0, {core})
+        except (OSError, ValueError):
+            ok = False
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except OSError:
+        ok = False
+    return ok
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Round-trip tests for the LeKiwi host/client observation wire format."""
+
+import base64
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("zmq", reason="pyzmq is required (install lerobot[lekiwi])")
+
+from lerobot.robots.lekiwi.config_lekiwi import LeKiwiClientConfig
+from lerobot.robots.lekiwi.lekiwi_client import LeKiwiClient
+from lerobot.robots.lekiwi.lekiwi_host import encode_jpeg, pack_observation_meta
+
+STATE = {
+    "arm_shoulder_pan.pos": 1.5,
+    "arm_gripper.pos": 42.0,
+    "x.vel": 0.12,
+    "y.vel": -0.3,
+    "theta.vel": 15.0,
+}
+
+
+def _make_frames(client: LeKiwiClient) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed=0)
+    return {
+        name: rng.integers(0, 256, size=shape, dtype=np.uint8).astype(np.uint8)
+        for name, shape in client._cameras_ft.items()
+    }
+
+
+def _observation_parts(state: dict, frames: dict[str, np.ndarray]) -> list[bytes]:
+    """Assemble a multipart observation the way lekiwi_host.main does."""
+    meta = dict(state)
+    meta["_image_encoding"] = "jpeg"
+    image_names = []
+    image_parts: list[bytes] = []
+    for cam_name, frame in frames.items():
+        jpeg = encode_jpeg(frame)
+        assert jpeg is not None
+        image_names.append(cam_name)
+        image_parts.extend([cam_name.encode("utf-8"), jpeg])
+    meta["_images"] = image_names
+    return [pack_observation_meta(meta), *image_parts]
+
+
+@pytest.fixture
+def client():
+    cfg = LeKiwiClientConfig(remote_ip="127.0.0.1", id="test_lekiwi_client")
+    return LeKiwiClient(cfg)
+
+
+def test_multipart_roundtrip(client):
+    frames = _make_frames(client)
+    parts = _observation_parts(STATE, frames)
+
+    parsed = client._parse_observation_message(parts)
+    assert parsed is not None
+    observation, decoded_frames = parsed
+
+    for key, value in STATE.items():
+        assert observation[key] == pytest.approx(value)
+    assert set(decoded_frames) == set(frames)
+    for cam_name, frame in frames.items():
+        assert decoded_frames[cam_name].shape == frame.shape
+        assert decoded_frames[cam_name].dtype == np.uint8
+
+
+def test_json_fallback_when_msgpack_absent(client):
+    frames = _make_frames(client)
+    with patch("lerobot.robots.lekiwi.lekiwi_host.msgpack", None):
+        parts = _observation_parts(STATE, frames)
+
+    # Without msgpack the meta part is a plain JSON object.
+    assert parts[0].startswith(b"{")
+    parsed = client._parse_observation_message(parts)
+    assert parsed is not None
+    observation, decoded_frames = parsed
+    assert observation["x.vel"] == pytest.approx(STATE["x.vel"])
+    assert set(decoded_frames) == set(frames)
+
+
+def test_msgpack_meta(client):
+    pytest.importorskip("msgpack", reason="msgpack is optional on the wire")
+    parts = _observation_parts(STATE, _make_frames(client))
+
+    # msgpack maps never start with '{'; the client dispatches on that byte.
+    assert not parts[0].startswith(b"{")
+    parsed = client._parse_observation_message(parts)
+    assert parsed is not None
+    observation, _ = parsed
+    assert observation["theta.vel"] == pytest.approx(STATE["theta.vel"])
+
+    # A client without msgpack cannot decode a msgpack meta and reports failure.
+    with patch("lerobot.robots.lekiwi.lekiwi_client.msgpack", None):
+        assert client._parse_observation_message(parts) is None
+
+
+def test_legacy_single_part_base64(client):
+    frames = _make_frames(client)
+    legacy = dict(STATE)
+    for cam_name, frame in frames.items():
+        jpeg = encode_jpeg(frame)
+        legacy[cam_name] = base64.b64encode(jpeg).decode("utf-8")
+
+    parsed = client._parse_observation_message([json.dumps(legacy).encode("utf-8")])
+    assert parsed is not None
+    observation, decoded_frames = parsed
+    assert observation["y.vel"] == pytest.approx(STATE["y.vel"])
+    assert set(decoded_frames) == set(frames)
+    for cam_name, frame in frames.items():
+        assert decoded_frames[cam_name].shape == frame.shape
+
+
+def test_odd_part_count_decodes_complete_pairs(client):
+    frames = _make_frames(client)
+    parts = _observation_parts(STATE, frames)
+    parts.append(b"dangling_name_without_jpeg")
+
+    parsed = client._parse_observation_message(parts)
+    assert parsed is not None
+    _, decoded_frames = parsed
+    assert set(decoded_frames) == set(frames)
+
+
+def test_unknown_camera_name_skipped(client):
+    frames = _make_frames(client)
+    parts = _observation_parts(STATE, frames)
+    some_frame = next(iter(frames.values()))
+    parts.extend([b"not_a_configured_camera", encode_jpeg(some_frame)])
+
+    parsed = client._parse_observation_message(parts)
+    assert parsed is not None
+    _, decoded_frames = parsed
+    assert set(decoded_frames) == set(frames)
+
+
+def test_empty_message_rejected(client):
+    assert client._parse_observation_message([]) is None